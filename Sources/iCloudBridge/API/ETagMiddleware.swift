@@ -0,0 +1,27 @@
+import Vapor
+import CryptoKit
+
+/// Middleware that tags JSON GET responses with an ETag and answers a matching
+/// If-None-Match with 304 Not Modified, so clients can revalidate cheaply
+struct ETagMiddleware: AsyncMiddleware {
+    func respond(to request: Request, chainingTo next: AsyncResponder) async throws -> Response {
+        let response = try await next.respond(to: request)
+
+        guard request.method == .GET,
+              response.status == .ok,
+              response.headers.contentType == .json,
+              let buffer = response.body.buffer else {
+            return response
+        }
+
+        let hash = SHA256.hash(data: Data(buffer.readableBytesView))
+        let etag = "\"" + hash.compactMap { String(format: "%02x", $0) }.joined() + "\""
+
+        if request.headers.first(name: .ifNoneMatch) == etag {
+            return Response(status: .notModified, headers: HTTPHeaders([("ETag", etag)]))
+        }
+
+        response.headers.replaceOrAdd(name: .eTag, value: etag)
+        return response
+    }
+}
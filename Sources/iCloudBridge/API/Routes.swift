@@ -18,7 +18,7 @@ func configureRoutes(
 
     // API routes with authentication middleware
     let authMiddleware = AuthMiddleware(tokenManager: tokenManager, isAuthEnabled: isAuthEnabled)
-    let api = app.grouped("api", "v1").grouped(authMiddleware)
+    let api = app.grouped("api", "v1").grouped(authMiddleware).grouped(ETagMiddleware())
 
     try api.register(collection: ListsController(
         remindersService: remindersService,
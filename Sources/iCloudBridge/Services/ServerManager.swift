@@ -50,6 +50,10 @@ actor ServerManager {
         newApp.http.server.configuration.hostname = allowRemoteConnections() ? "0.0.0.0" : "127.0.0.1"
         newApp.http.server.configuration.port = port
 
+        // Compress responses for clients that send Accept-Encoding (JSON lists
+        // of reminders and photos shrink considerably; media is left as-is)
+        newApp.http.server.configuration.responseCompression = .enabled
+
         // Configure JSON encoder for dates
         let encoder = JSONEncoder()
         encoder.dateEncodingStrategy = .iso8601
@@ -15,9 +15,11 @@ from .icloudbridge import (
     NotFoundError,
     APIError,
 )
+from .icloudbridge_async import AsyncICloudBridge
 
 __all__ = [
     "iCloudBridge",
+    "AsyncICloudBridge",
     "connect",
     "Album",
     "Photo",
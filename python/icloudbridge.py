@@ -2,7 +2,9 @@
 iCloud Bridge Python Client
 
 A Python client library for interacting with the iCloud Bridge REST API.
-Uses only the standard library - no external dependencies required.
+Uses only the standard library - no external dependencies required. If orjson
+is installed it is used for faster JSON encoding and decoding, and if ijson is
+installed very large photo pages are parsed incrementally as they arrive.
 
 Basic Usage:
     from icloudbridge import iCloudBridge
@@ -68,16 +70,59 @@ Remote Connections:
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import http.client
 import json
-import urllib.request
-import urllib.error
+import os
+import random
+import select
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterator, Optional
+from functools import lru_cache
+from itertools import islice, repeat
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, Iterator, Optional, TypeVar, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+T = TypeVar("T")
+
+# Domain objects are created in bulk (e.g. thousands of photos per album), so
+# use __slots__ where dataclasses support it (Python 3.10+) to drop the
+# per-instance __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Required fields of the records that are parsed in bulk, fetched with a single
+# C-level lookup per record instead of one subscript each
+_REMINDER_FIELDS = itemgetter("id", "title", "isCompleted", "priority", "listId")
+_PHOTO_FIELDS = itemgetter(
+    "id", "albumId", "mediaType", "creationDate", "width", "height", "isFavorite", "isHidden"
+)
+
+# Parent IDs and media types repeat across every item in a listing; interning
+# them makes all items share one string object instead of one copy each
+_intern = sys.intern
+
+
+@dataclass(**_SLOTS)
 class ReminderList:
     """
     Represents a Reminders list from iCloud.
@@ -95,7 +140,7 @@ class ReminderList:
     _client: Optional["iCloudBridge"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, data: dict, client: "iCloudBridge" = None) -> ReminderList:
+    def from_dict(cls, data: dict, client: Optional["iCloudBridge"] = None) -> ReminderList:
         return cls(
             id=data["id"],
             title=data["title"],
@@ -178,7 +223,7 @@ class ReminderList:
         return self._client.create_reminder(self.id, title, notes=notes, priority=priority, due_date=due_date)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Reminder:
     """
     Represents a single reminder item.
@@ -204,27 +249,31 @@ class Reminder:
     _client: Optional["iCloudBridge"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, data: dict, client: "iCloudBridge" = None) -> Reminder:
-        due_date = None
-        if data.get("dueDate"):
-            due_date = _parse_iso_date(data["dueDate"])
+    def from_dict(cls, data: dict, client: Optional["iCloudBridge"] = None) -> Reminder:
+        reminder_id, title, is_completed, priority, list_id = _REMINDER_FIELDS(data)
+        get = data.get
 
-        completion_date = None
-        if data.get("completionDate"):
-            completion_date = _parse_iso_date(data["completionDate"])
+        due_date = get("dueDate")
+        completion_date = get("completionDate")
 
+        # Positional arguments in field order (cheaper than keywords in bulk)
         return cls(
-            id=data["id"],
-            title=data["title"],
-            notes=data.get("notes"),
-            is_completed=data["isCompleted"],
-            priority=data["priority"],
-            due_date=due_date,
-            completion_date=completion_date,
-            list_id=data["listId"],
-            _client=client,
+            reminder_id,
+            title,
+            get("notes"),
+            is_completed,
+            priority,
+            _parse_iso_date(due_date) if due_date else None,
+            _parse_iso_date(completion_date) if completion_date else None,
+            _intern(list_id),
+            client,
         )
 
+    @classmethod
+    def from_list(cls, items: list[dict], client: Optional["iCloudBridge"] = None) -> list[Reminder]:
+        """Build reminders from a list of API dicts."""
+        return list(map(cls.from_dict, items, repeat(client)))
+
     def save(self) -> "Reminder":
         """
         Save changes to this reminder.
@@ -303,7 +352,7 @@ class Reminder:
         self._client.delete_reminder(self.id)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Album:
     """
     Represents a photo album from the Photos library.
@@ -327,7 +376,7 @@ class Album:
     _client: Optional["iCloudBridge"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, data: dict, client: "iCloudBridge" = None) -> Album:
+    def from_dict(cls, data: dict, client: Optional["iCloudBridge"] = None) -> Album:
         start_date = None
         if data.get("startDate"):
             start_date = _parse_iso_date(data["startDate"])
@@ -392,6 +441,36 @@ class Album:
             raise RuntimeError("Album not associated with a client")
         yield from self._client._iter_photos(self.id, media_type="live")
 
+    def iter_photos(
+        self,
+        sort: str = "album",
+        media_type: Optional[str] = None,
+        prefetch: bool = True,
+        page_size: int = 100
+    ) -> Iterator[Photo]:
+        """
+        Iterate photos with explicit control, auto-paginating.
+
+        Args:
+            sort: Sort order - "album", "date-asc", or "date-desc"
+            media_type: Filter by type - "photo", "video", "live", or "all"
+            prefetch: Fetch upcoming pages concurrently in the background while
+                the current page is consumed (default: True)
+            page_size: Photos per request; use a small value when only the
+                first few photos are needed (default: 100)
+
+        Yields:
+            Photo: Each matching photo in the album
+
+        Raises:
+            RuntimeError: If album was not created by a client
+        """
+        if self._client is None:
+            raise RuntimeError("Album not associated with a client")
+        yield from self._client._iter_photos(
+            self.id, sort=sort, media_type=media_type, prefetch=prefetch, page_size=page_size
+        )
+
     def get_photos(
         self,
         limit: int = 100,
@@ -418,8 +497,48 @@ class Album:
             raise RuntimeError("Album not associated with a client")
         return self._client.get_photos(self.id, limit=limit, offset=offset, sort=sort, media_type=media_type)
 
+    def fetch_thumbnails(self, size: str = "medium", concurrency: int = 16) -> Iterator[tuple[Photo, bytes]]:
+        """
+        Download thumbnails for all photos in the album in parallel.
+
+        Thumbnails are yielded as each download finishes, so they arrive in
+        completion order rather than album order.
+
+        Args:
+            size: "small" (200px) or "medium" (800px)
+            concurrency: Maximum number of downloads in flight at once (default: 16)
+
+        Yields:
+            tuple[Photo, bytes]: Each photo and its JPEG thumbnail data
+
+        Raises:
+            RuntimeError: If album was not created by a client
+        """
+        if self._client is None:
+            raise RuntimeError("Album not associated with a client")
+        client = self._client
+        photos = client._iter_photos(self.id)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Keep at most `concurrency` downloads queued so large albums are
+            # not listed in full before the first thumbnail arrives
+            pending = {}
+            for photo in photos:
+                pending[executor.submit(client.get_thumbnail, photo.id, size)] = photo
+                if len(pending) >= concurrency:
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    photo = pending.pop(future)
+                    next_photo = next(photos, None)
+                    if next_photo is not None:
+                        pending[executor.submit(client.get_thumbnail, next_photo.id, size)] = next_photo
+                    yield photo, future.result()
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class Photo:
     """
     Represents a single photo or video from the Photos library.
@@ -451,28 +570,35 @@ class Photo:
     _client: Optional["iCloudBridge"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, data: dict, client: "iCloudBridge" = None) -> Photo:
-        creation_date = _parse_iso_date(data["creationDate"])
+    def from_dict(cls, data: dict, client: Optional["iCloudBridge"] = None) -> Photo:
+        (
+            photo_id, album_id, media_type, creation_date, width, height, is_favorite, is_hidden
+        ) = _PHOTO_FIELDS(data)
+        get = data.get
 
-        modification_date = None
-        if data.get("modificationDate"):
-            modification_date = _parse_iso_date(data["modificationDate"])
+        modification_date = get("modificationDate")
 
+        # Positional arguments in field order (cheaper than keywords in bulk)
         return cls(
-            id=data["id"],
-            album_id=data["albumId"],
-            media_type=data["mediaType"],
-            creation_date=creation_date,
-            modification_date=modification_date,
-            width=data["width"],
-            height=data["height"],
-            is_favorite=data["isFavorite"],
-            is_hidden=data["isHidden"],
-            filename=data.get("filename"),
-            file_size=data.get("fileSize"),
-            _client=client,
+            photo_id,
+            _intern(album_id),
+            _intern(media_type),
+            _parse_iso_date(creation_date),
+            _parse_iso_date(modification_date) if modification_date else None,
+            width,
+            height,
+            is_favorite,
+            is_hidden,
+            get("filename"),
+            get("fileSize"),
+            client,
         )
 
+    @classmethod
+    def from_list(cls, items: list[dict], client: Optional["iCloudBridge"] = None) -> list[Photo]:
+        """Build photos from a list of API dicts."""
+        return list(map(cls.from_dict, items, repeat(client)))
+
     @property
     def is_video(self) -> bool:
         """Check if this is a video."""
@@ -571,13 +697,21 @@ class Photo:
             raise RuntimeError("Photo not associated with a client")
         return self._client.get_thumbnail(self.id, size=size)
 
-    def get_image(self, wait: bool = False, max_retries: int = 10) -> bytes:
+    def get_image(
+        self,
+        wait: bool = False,
+        max_retries: int = 10,
+        max_wait: Optional[float] = None,
+        max_sleep: Optional[float] = None,
+    ) -> bytes:
         """
         Get full-resolution image with explicit control.
 
         Args:
             wait: If True, block until download completes
             max_retries: Maximum retry attempts for non-blocking mode
+            max_wait: Maximum total seconds to spend waiting between retries
+            max_sleep: Maximum seconds to sleep before any single retry
 
         Returns:
             bytes: Image data
@@ -587,10 +721,64 @@ class Photo:
         """
         if self._client is None:
             raise RuntimeError("Photo not associated with a client")
-        return self._client.get_image(self.id, wait=wait, max_retries=max_retries)
+        return self._client.get_image(
+            self.id, wait=wait, max_retries=max_retries, max_wait=max_wait, max_sleep=max_sleep
+        )
+
+    def download_image(
+        self,
+        dest: Union[str, os.PathLike, BinaryIO],
+        wait: bool = False,
+        max_retries: int = 10,
+        max_wait: Optional[float] = None,
+        max_sleep: Optional[float] = None,
+    ) -> None:
+        """
+        Download the full-resolution image to a file without holding it in memory.
+
+        Args:
+            dest: File path or writable binary file object
+            wait: If True, block until download completes
+            max_retries: Maximum retry attempts for non-blocking mode
+            max_wait: Maximum total seconds to spend waiting between retries
+            max_sleep: Maximum seconds to sleep before any single retry
+
+        Raises:
+            RuntimeError: If photo was not created by a client
+        """
+        if self._client is None:
+            raise RuntimeError("Photo not associated with a client")
+        self._client.download_image(
+            self.id, dest, wait=wait, max_retries=max_retries, max_wait=max_wait, max_sleep=max_sleep
+        )
+
+    def download_video(self, dest: Union[str, os.PathLike, BinaryIO]) -> None:
+        """
+        Download video data to a file without holding it in memory.
+
+        For Live Photos, downloads the motion video component.
 
+        Args:
+            dest: File path or writable binary file object
 
-@dataclass
+        Raises:
+            RuntimeError: If photo was not created by a client
+            ValueError: If this is not a video or Live Photo
+        """
+        if self._client is None:
+            raise RuntimeError("Photo not associated with a client")
+        if self.media_type == "video":
+            self._client.download_video(self.id, dest)
+        elif self.media_type == "livePhoto":
+            self._client.download_live_video(self.id, dest)
+        else:
+            raise ValueError(
+                f"Cannot get video for media type '{self.media_type}'. "
+                "Only videos and Live Photos have video data."
+            )
+
+
+@dataclass(**_SLOTS)
 class Alarm:
     """
     Represents an alarm/alert for a calendar event.
@@ -608,7 +796,7 @@ class Alarm:
         return {"offsetMinutes": self.offset_minutes}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RecurrenceRule:
     """
     Represents a recurrence rule for a calendar event.
@@ -659,7 +847,7 @@ class RecurrenceRule:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Calendar:
     """
     Represents a calendar from iCloud.
@@ -679,7 +867,7 @@ class Calendar:
     _client: Optional["iCloudBridge"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, data: dict, client: "iCloudBridge" = None) -> "Calendar":
+    def from_dict(cls, data: dict, client: Optional["iCloudBridge"] = None) -> "Calendar":
         return cls(
             id=data["id"],
             title=data["title"],
@@ -779,7 +967,7 @@ class Calendar:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Event:
     """
     Represents a calendar event from iCloud.
@@ -819,7 +1007,7 @@ class Event:
     _client: Optional["iCloudBridge"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, data: dict, client: "iCloudBridge" = None) -> "Event":
+    def from_dict(cls, data: dict, client: Optional["iCloudBridge"] = None) -> "Event":
         start_date = _parse_iso_date(data["startDate"])
         end_date = _parse_iso_date(data["endDate"])
 
@@ -929,17 +1117,31 @@ class APIError(iCloudBridgeError):
         super().__init__(f"API error {status_code}: {reason}")
 
 
-def _parse_iso_date(date_str: str) -> datetime:
-    """Parse an ISO 8601 date string."""
-    # Handle various ISO formats
-    date_str = date_str.replace("Z", "+00:00")
-    try:
-        return datetime.fromisoformat(date_str)
-    except ValueError:
-        # Fallback for formats without timezone
-        if "." in date_str:
-            return datetime.strptime(date_str.split(".")[0], "%Y-%m-%dT%H:%M:%S")
-        return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts every ISO 8601 form the server sends, including a
+    # trailing "Z" and any number of fractional digits
+    _parse_iso_date = datetime.fromisoformat
+else:
+    def _parse_iso_date(date_str: str, _fromisoformat=datetime.fromisoformat) -> datetime:
+        """Parse an ISO 8601 date string."""
+        # Fast path for the server's canonical format (e.g. "2025-01-02T03:04:05Z")
+        try:
+            if date_str.endswith("Z"):
+                return _fromisoformat(date_str[:-1] + "+00:00")
+            return _fromisoformat(date_str)
+        except ValueError:
+            # Fallback for formats fromisoformat can't handle (e.g. fractional
+            # seconds that aren't 3 or 6 digits before Python 3.11). The leading
+            # "YYYY-MM-DDTHH:MM:SS" is fixed-width, so slice it rather than going
+            # through strptime.
+            return datetime(
+                int(date_str[0:4]),
+                int(date_str[5:7]),
+                int(date_str[8:10]),
+                int(date_str[11:13]),
+                int(date_str[14:16]),
+                int(date_str[17:19]),
+            )
 
 
 def _format_iso_date(dt: datetime) -> str:
@@ -947,6 +1149,391 @@ def _format_iso_date(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def _decode_content(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Decompress a response body according to its Content-Encoding."""
+    if content_encoding == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+# Bounds for the backoff between polls of a pending download, in seconds
+_MIN_BACKOFF_DELAY = 0.5
+_MAX_BACKOFF_DELAY = 30.0
+
+
+def _backoff_delay(
+    retry_after: float,
+    attempt: int,
+    deadline: Optional[float] = None,
+    max_sleep: Optional[float] = None,
+) -> float:
+    """
+    Get how long to wait before polling a pending download again.
+
+    The delay is drawn at random ("full jitter") between a small floor and a
+    ceiling that starts at the server's Retry-After hint and doubles with each
+    attempt. It is capped at ``max_sleep`` if given, and cut short so the
+    total wait does not pass ``deadline``.
+
+    Raises:
+        iCloudBridgeError: If the deadline has already passed
+    """
+    upper = max(_MIN_BACKOFF_DELAY, min(retry_after * 2 ** attempt, _MAX_BACKOFF_DELAY))
+    delay = random.uniform(_MIN_BACKOFF_DELAY, upper)
+    if max_sleep is not None:
+        delay = min(delay, max_sleep)
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise iCloudBridgeError("Image download timed out waiting for iCloud")
+        delay = min(delay, remaining)
+    return delay
+
+
+@lru_cache(maxsize=4096)
+def _quote_id(value: str) -> str:
+    """URL-quote an identifier for use in a request path."""
+    # Slashes are kept as-is: Photos IDs contain them (e.g. "ABC123/L0/001")
+    # and the server matches those routes with catch-all path components.
+    return urllib.parse.quote(value)
+
+
+@contextmanager
+def _open_dest(dest: Union[str, os.PathLike, BinaryIO]) -> Iterator[BinaryIO]:
+    """Open a download destination, removing a partially written file on error."""
+    if not isinstance(dest, (str, os.PathLike)):
+        yield dest
+        return
+    with open(dest, "wb") as fh:
+        try:
+            yield fh
+        except BaseException:
+            fh.close()
+            os.remove(dest)
+            raise
+
+
+# JSON encoding/decoding work directly on bytes, using orjson when available
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+# Photo pages asking for more than this many photos are parsed incrementally
+# when ijson is available, instead of first reading the whole body
+_STREAM_PHOTOS_LIMIT = 1000
+
+
+def _parse_photos_stream(source: BinaryIO, client: iCloudBridge) -> tuple[list[Photo], int]:
+    """
+    Parse a photos page from a file-like object with ijson.
+
+    Each photo's JSON object is turned into a Photo as soon as it is complete,
+    so neither the raw body nor the full decoded page is ever held in memory.
+
+    Returns:
+        tuple[list[Photo], int]: The photos and the total count in the album
+    """
+    photos: list[Photo] = []
+    total = 0
+    builder = None
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "photos.item" and event == "end_map":
+                photos.append(Photo.from_dict(builder.value, client))
+                builder = None
+        elif prefix == "photos.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "total" and event == "number":
+            total = int(value)
+    return photos, total
+
+
+# Errors raised when a pooled keep-alive connection was closed by the server
+# while it sat idle. These are retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+# Methods that are safe to send again after the server may already have
+# acted on them (POST is not: a lost response may still have created the
+# reminder)
+_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+
+def _is_connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """
+    Check whether an idle pooled connection has been closed by the server.
+
+    Nothing is expected on an idle keep-alive socket, so a readable one has
+    either reached EOF or holds unsolicited data; it cannot be used either way.
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    if hasattr(select, "poll"):
+        # poll has no limit on descriptor numbers, unlike select
+        poller = select.poll()
+        poller.register(sock, select.POLLIN)
+        return bool(poller.poll(0))
+    return bool(select.select([sock], [], [], 0)[0])
+
+
+class _ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP connections to a single host.
+
+    A connection is checked out for one request/response exchange and returned
+    to the pool once the response body has been fully read, so consecutive
+    calls reuse the same socket instead of opening a new one each time.
+
+    Args:
+        host: The hostname to connect to
+        port: The port number to connect to
+        maxsize: Maximum number of idle connections kept for reuse
+    """
+
+    def __init__(self, host: str, port: int, maxsize: int = 16):
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> tuple[http.client.HTTPConnection, bool]:
+        """
+        Check out an idle connection, or create one. Returns (conn, reused).
+
+        Idle connections the server has since closed (after its keep-alive
+        timeout, or a restart) are discarded rather than handed out.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if not _is_connection_dropped(conn):
+                return conn, True
+            conn.close()
+        return http.client.HTTPConnection(self.host, self.port), False
+
+    def _put_conn(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def urlopen(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send a request and yield the response.
+
+        The connection goes back to the pool on exit if the response was read
+        to completion; otherwise it is closed. If a reused connection turns
+        out to have been closed by the server, the request is sent again on a
+        fresh one, unless the connection was reset after the request went out
+        and the request is not safe to repeat.
+
+        Raises:
+            OSError: If the connection fails
+            http.client.HTTPException: If the server sends a malformed response
+        """
+        conn, reused = self._get_conn()
+        while True:
+            sent = False
+            try:
+                conn.request(method, url, body=body, headers=headers or {})
+                sent = True
+                response = conn.getresponse()
+                break
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                # A clean close before any response byte means the server shut
+                # the connection without taking the request. After a reset
+                # there is no telling whether it acted on the request first.
+                clean_close = isinstance(e, http.client.RemoteDisconnected)
+                if not reused or (sent and not clean_close and method not in _RETRY_METHODS):
+                    raise
+                conn, reused = http.client.HTTPConnection(self.host, self.port), False
+            except BaseException:
+                conn.close()
+                raise
+
+        try:
+            yield response
+        finally:
+            if response.isclosed() and not response.will_close:
+                self._put_conn(conn)
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+# Hosts for which response compression is not worth requesting
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Gateway errors worth retrying (for the methods in _RETRY_METHODS)
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+# Connection pools keyed by (host, port), shared by every client instance so
+# that creating a new client does not discard warm connections
+_POOLS: dict[tuple[str, int], _ConnectionPool] = {}
+
+
+class _DiskCache:
+    """
+    Size-bounded on-disk cache of immutable binary blobs.
+
+    Entries are stored as files named by the SHA-256 of their key. Writes go
+    to a temporary file that is renamed into place, so concurrent readers
+    never see a partial entry. When the total size exceeds ``size_limit``,
+    the least recently used entries are removed until it is back down to 90%
+    of the limit.
+
+    Args:
+        directory: Directory to store entries in (created if missing)
+        size_limit: Maximum total size of all entries in bytes (default: 1 GiB)
+    """
+
+    def __init__(self, directory: str, size_limit: int = 1 << 30):
+        self.directory = os.path.expanduser(directory)
+        self.size_limit = size_limit
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the value stored under key, or None if it is not cached."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            # Mark as recently used for eviction
+            os.utime(path)
+        except OSError:
+            return None
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value under key, evicting old entries if over the size limit."""
+        path = self._path(key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            try:
+                old_size = os.path.getsize(path)
+            except OSError:
+                old_size = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is an optimization; a failed write is not an error
+            return
+        with self._lock:
+            self._size += len(value) - old_size
+            if self._size > self.size_limit:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under 90% of the size limit."""
+        # Freeing some headroom means the directory scan below runs once per
+        # tenth of the cache written, rather than on every write once it is full
+        target = self.size_limit * 9 // 10
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+
+
+class _LRUCache:
+    """
+    Thread-safe least-recently-used cache whose entries expire after a TTL.
+
+    Args:
+        maxsize: Maximum number of entries; 0 disables the cache
+        ttl: Seconds an entry stays valid; 0 disables the cache
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Get a cached value if present and not expired, else None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self.update(((key, value),))
+
+    def update(self, items) -> None:
+        """Store several (key, value) pairs at once."""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            data = self._data
+            for key, value in items:
+                data[key] = (now, value)
+                data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
 class iCloudBridge:
     """
     Client for the iCloud Bridge REST API.
@@ -955,54 +1542,301 @@ class iCloudBridge:
         host: The hostname of the iCloud Bridge server (default: localhost)
         port: The port number (default: 31337)
         token: Bearer token for authentication (required for remote connections)
+        cache_ttl: Seconds to cache album, reminder list and photo metadata;
+            0 disables caching (default: 300)
+        cache_size: Maximum number of albums, lists and photos each kept in
+            the metadata cache; 0 disables caching (default: 256)
+        cache_dir: Directory for a persistent cache of downloaded thumbnails;
+            None disables it (default: None)
+        cache_images: Also keep full-resolution images in ``cache_dir``
+            (default: False)
+        retry_total: Times to retry a request after a connection error or a
+            502/503/504 response; 0 disables retries (default: 3)
+        backoff_factor: Seconds to wait before the first retry, doubling
+            for each one after it (default: 0.3)
+
+    All clients connected to the same host and port share one pool of
+    keep-alive connections.
     """
 
-    def __init__(self, host: str = "localhost", port: int = 31337, token: Optional[str] = None):
+    #: Number of photo pages fetched ahead of the caller when iterating an album
+    prefetch_pages = 4
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 31337,
+        token: Optional[str] = None,
+        cache_ttl: float = 300,
+        cache_size: int = 256,
+        cache_dir: Optional[str] = None,
+        cache_images: bool = False,
+        retry_total: int = 3,
+        backoff_factor: float = 0.3,
+    ):
         self.base_url = f"http://{host}:{port}/api/v1"
-        self._health_url = f"http://{host}:{port}/health"
+        self._base_path = "/api/v1"
         self._token = token
+        self._http = _POOLS.setdefault((host, port), _ConnectionPool(host, port, maxsize=16))
+        # Request headers are the same for every call, so build them once
+        self._headers: dict[str, str] = {}
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+        # JSON compresses well over a network, but on loopback compressing and
+        # decompressing only costs CPU. Binary downloads are never gzipped.
+        if host not in _LOOPBACK_HOSTS:
+            self._json_headers["Accept-Encoding"] = "gzip"
+        # Metadata caches keyed by ID, with None holding the full collection
+        self._album_cache = _LRUCache(cache_size, cache_ttl)
+        self._list_cache = _LRUCache(cache_size, cache_ttl)
+        self._photo_cache = _LRUCache(cache_size, cache_ttl)
+        self._album_paths: dict[str, str] = {}
+        # Last ETag and parsed body for recently used metadata GET paths, for
+        # conditional requests; entries stay valid until the server says
+        # otherwise. Only small responses are kept (see _request).
+        self._etag_cache = _LRUCache(maxsize=128, ttl=float("inf"))
+        # Thumbnails and images never change for a given photo, so they can be
+        # kept on disk across sessions
+        self._disk_cache = _DiskCache(cache_dir) if cache_dir is not None else None
+        self._cache_images = cache_images
+        self.retry_total = retry_total
+        self.backoff_factor = backoff_factor
+
+    def invalidate_cache(self) -> None:
+        """
+        Discard cached album, reminder list and photo metadata.
+
+        The next lookup of any album, list or photo will fetch fresh data from
+        the server.
+        """
+        self._album_cache.clear()
+        self._list_cache.clear()
+        self._photo_cache.clear()
+
+    def _invalidate_list(self, list_id: str) -> None:
+        """Drop a cached list whose reminder count has changed."""
+        self._list_cache.pop(list_id)
+        self._list_cache.pop(None)
+
+    def _request_with_query(self, path: str, params: dict[str, Any]) -> Any:
+        """Make a GET request, appending params (if any) as a query string."""
+        if params:
+            path = f"{path}?{urllib.parse.urlencode(params)}"
+        return self._request("GET", path)
+
+    def _request_raw(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+        retry: bool = True,
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """
+        Send a request over the connection pool and read the whole response.
+
+        Connection errors and gateway errors (502, 503, 504) are retried up
+        to ``retry_total`` times with exponential backoff, except for POST
+        requests.
 
-    def _get_headers(self, content_type: Optional[str] = None) -> dict:
-        """Get headers including auth token if set."""
-        headers = {}
-        if content_type:
-            headers["Content-Type"] = content_type
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
+        Args:
+            method: HTTP method
+            url: Request path on the server, including any query string
+            body: Request body
+            headers: Request headers
+            retry: Set to False to fail on the first error instead
+
+        Returns:
+            tuple[HTTPResponse, bytes]: The response and its decoded body
+
+        Raises:
+            iCloudBridgeError: If the connection fails
+        """
+        retries = self.retry_total if retry and method in _RETRY_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                with self._http.urlopen(method, url, body=body, headers=headers) as response:
+                    payload = _decode_content(response.read(), response.getheader("Content-Encoding"))
+            except (OSError, http.client.HTTPException) as e:
+                if attempt >= retries:
+                    raise iCloudBridgeError(f"Connection failed: {e}")
+            else:
+                if response.status not in _RETRY_STATUSES or attempt >= retries:
+                    return response, payload
+            time.sleep(self.backoff_factor * 2 ** attempt)
+            attempt += 1
 
     def _request(
         self,
         method: str,
         path: str,
         data: Optional[dict] = None,
-    ) -> Optional[dict | list]:
-        """Make an HTTP request to the API."""
-        url = f"{self.base_url}{path}"
+        revalidate: bool = False,
+    ) -> Any:
+        """
+        Make an HTTP request to the API.
 
-        headers = self._get_headers(content_type="application/json")
+        With ``revalidate``, a GET response is kept along with its ETag and
+        later requests for the same path ask the server whether it changed.
+        This is meant for small metadata responses only: the parsed body stays
+        in memory until the next write.
+        """
+        url = f"{self._base_path}{path}"
+
+        headers = self._json_headers
         body = None
         if data is not None:
-            body = json.dumps(data).encode("utf-8")
+            body = _dumps(data)
 
-        request = urllib.request.Request(url, data=body, headers=headers, method=method)
+        # Revalidate previously seen GET responses instead of re-downloading them
+        cached = self._etag_cache.get(path) if revalidate and method == "GET" else None
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
 
-        try:
-            with urllib.request.urlopen(request) as response:
-                if response.status == 204:
-                    return None
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise NotFoundError(f"Resource not found: {path}")
+        response, payload = self._request_raw(method, url, body=body, headers=headers)
+
+        if response.status == 304 and cached is not None:
+            return cached[1]
+        if response.status == 404:
+            raise NotFoundError(f"Resource not found: {path}")
+        if response.status >= 400:
+            reason = f"HTTP Error {response.status}: {response.reason}"
             try:
-                error_body = json.loads(e.read().decode("utf-8"))
-                reason = error_body.get("reason", str(e))
+                error_body = _loads(payload)
+                reason = error_body.get("reason", reason)
             except (json.JSONDecodeError, UnicodeDecodeError):
-                reason = str(e)
-            raise APIError(e.code, reason)
-        except urllib.error.URLError as e:
-            raise iCloudBridgeError(f"Connection failed: {e.reason}")
+                pass
+            raise APIError(response.status, reason)
+        if method != "GET":
+            # A write may change any number of cached GET responses
+            self._etag_cache.clear()
+        if response.status == 204:
+            return None
+        result = _loads(payload)
+        if revalidate and method == "GET":
+            etag = response.getheader("ETag")
+            if etag:
+                self._etag_cache.set(path, (etag, result))
+        return result
+
+    def _get_bytes(self, path: str, photo_id: str) -> tuple[http.client.HTTPResponse, bytes]:
+        """
+        Download a binary photo resource into memory.
+
+        Args:
+            path: API path of the resource, including any query string
+            photo_id: The photo identifier, used in error messages
+
+        Returns:
+            tuple[HTTPResponse, bytes]: The response and its body; the status
+            may be 202 for a download that is still pending
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the API returns an error
+        """
+        response, payload = self._request_raw("GET", f"{self._base_path}{path}", headers=self._headers)
+        if response.status == 404:
+            raise NotFoundError(f"Photo not found: {photo_id}")
+        if response.status >= 400:
+            raise APIError(response.status, f"HTTP Error {response.status}: {response.reason}")
+        return response, payload
+
+    def _stream(
+        self,
+        path: str,
+        consume: Callable[[BinaryIO], T],
+        headers: dict[str, str],
+    ) -> tuple[http.client.HTTPResponse, Optional[T]]:
+        """
+        Make a GET request, handing a 200 response body to consume as a stream.
+
+        The body is never read into memory as a whole by this method. Other
+        successful responses (such as 202 for a pending download) are returned
+        with their body discarded, so the caller can inspect them. Failures are
+        retried like in ``_request_raw``, but only until consume has started.
+
+        Args:
+            path: API path of the resource, including any query string
+            consume: Called with the (decompressed) body of a 200 response
+            headers: Request headers
+
+        Returns:
+            tuple[HTTPResponse, Optional[T]]: The response, already read to
+            completion, and what consume returned (None if not called)
+
+        Raises:
+            NotFoundError: If the resource is not found
+            APIError: If the API returns an error
+        """
+        url = f"{self._base_path}{path}"
+
+        attempt = 0
+        while True:
+            result = None
+            streaming = False
+            try:
+                with self._http.urlopen("GET", url, headers=headers) as response:
+                    if response.status == 200:
+                        streaming = True
+                        if response.getheader("Content-Encoding") == "gzip":
+                            with gzip.GzipFile(fileobj=response) as body:
+                                result = consume(body)  # type: ignore[arg-type]
+                        else:
+                            result = consume(response)
+                    else:
+                        response.read()
+            except (OSError, http.client.HTTPException) as e:
+                # Once consume has seen part of the body, starting over could
+                # leave it with duplicate data
+                if streaming or attempt >= self.retry_total:
+                    raise iCloudBridgeError(f"Connection failed: {e}")
+            else:
+                if response.status not in _RETRY_STATUSES or attempt >= self.retry_total:
+                    break
+            time.sleep(self.backoff_factor * 2 ** attempt)
+            attempt += 1
+
+        if response.status == 404:
+            raise NotFoundError(f"Resource not found: {path}")
+        if response.status >= 400:
+            raise APIError(response.status, f"HTTP Error {response.status}: {response.reason}")
+        return response, result
+
+    def _download(
+        self,
+        path: str,
+        dest: Union[str, os.PathLike, BinaryIO],
+        chunk_size: int = 1 << 16,
+    ) -> http.client.HTTPResponse:
+        """
+        Make a GET request, streaming a 200 response body into dest in chunks.
+
+        Only one chunk is held in memory at a time. The destination is opened
+        only once the server has answered with content, so other successful
+        responses (such as 202 for a pending download) leave no empty file
+        behind.
+
+        Args:
+            path: API path of the resource, including any query string
+            dest: File path or writable binary file object
+            chunk_size: Number of bytes copied at a time (default: 64 KiB)
+
+        Returns:
+            HTTPResponse: The response, already read to completion
+
+        Raises:
+            NotFoundError: If the resource is not found
+            APIError: If the API returns an error
+        """
+        def copy(body: BinaryIO) -> None:
+            with _open_dest(dest) as sink:
+                shutil.copyfileobj(body, sink, chunk_size)
+
+        response, _ = self._stream(path, copy, self._headers)
+        return response
 
     # Health check
 
@@ -1010,16 +1844,21 @@ class iCloudBridge:
         """
         Check if the server is running.
 
+        Unlike other requests this is not retried, so a server that is down
+        is reported straight away.
+
         Returns:
             dict: Health status (e.g., {"status": "ok"})
         """
-        request = urllib.request.Request(self._health_url)
         try:
-            with urllib.request.urlopen(request) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.URLError as e:
+            response, payload = self._request_raw("GET", "/health", retry=False)
+        except iCloudBridgeError as e:
             raise iCloudBridgeError(f"Health check failed: {e}")
 
+        if response.status >= 400:
+            raise iCloudBridgeError(f"Health check failed: HTTP Error {response.status}: {response.reason}")
+        return _loads(payload)
+
     # Collection properties
 
     @property
@@ -1073,8 +1912,13 @@ class iCloudBridge:
         Returns:
             list[ReminderList]: All reminder lists configured in iCloud Bridge
         """
-        data = self._request("GET", "/lists")
-        return [ReminderList.from_dict(item, self) for item in data]
+        lists = self._list_cache.get(None)
+        if lists is None:
+            data = self._request("GET", "/lists", revalidate=True)
+            lists = [ReminderList.from_dict(item, self) for item in data]
+            self._list_cache.set(None, lists)
+            self._list_cache.update((lst.id, lst) for lst in lists)
+        return list(lists)
 
     def get_list(self, list_id: str) -> ReminderList:
         """
@@ -1089,8 +1933,12 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the list is not found
         """
-        data = self._request("GET", f"/lists/{urllib.parse.quote(list_id)}")
-        return ReminderList.from_dict(data, self)
+        lst = self._list_cache.get(list_id)
+        if lst is None:
+            data = self._request("GET", f"/lists/{_quote_id(list_id)}", revalidate=True)
+            lst = ReminderList.from_dict(data, self)
+            self._list_cache.set(list_id, lst)
+        return lst
 
     # Reminder operations
 
@@ -1111,11 +1959,37 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the list is not found
         """
-        path = f"/lists/{urllib.parse.quote(list_id)}/reminders"
+        path = f"/lists/{_quote_id(list_id)}/reminders"
         if include_completed:
             path += "?includeCompleted=true"
         data = self._request("GET", path)
-        return [Reminder.from_dict(item, self) for item in data]
+        return Reminder.from_list(data, self)
+
+    def get_all_reminders(
+        self,
+        include_completed: bool = False,
+        concurrency: int = 8
+    ) -> dict[str, list[Reminder]]:
+        """
+        Get the reminders in every list.
+
+        The lists are fetched in parallel, so this takes roughly as long as the
+        slowest single list rather than the sum of all of them.
+
+        Args:
+            include_completed: Whether to include completed reminders (default: False)
+            concurrency: Maximum number of lists fetched at once (default: 8)
+
+        Returns:
+            dict[str, list[Reminder]]: Reminders keyed by list ID
+        """
+        lists = self.get_lists()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = executor.map(
+                lambda reminder_list: self.get_reminders(reminder_list.id, include_completed=include_completed),
+                lists,
+            )
+            return {reminder_list.id: reminders for reminder_list, reminders in zip(lists, results)}
 
     def get_reminder(self, reminder_id: str) -> Reminder:
         """
@@ -1130,7 +2004,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the reminder is not found
         """
-        data = self._request("GET", f"/reminders/{urllib.parse.quote(reminder_id)}")
+        data = self._request("GET", f"/reminders/{_quote_id(reminder_id)}")
         return Reminder.from_dict(data, self)
 
     def _iter_reminders(self, list_id: str, include_completed: bool = False) -> Iterator[Reminder]:
@@ -1172,7 +2046,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the list is not found
         """
-        payload = {"title": title}
+        payload: dict[str, Any] = {"title": title}
         if notes is not None:
             payload["notes"] = notes
         if priority is not None:
@@ -1180,7 +2054,8 @@ class iCloudBridge:
         if due_date is not None:
             payload["dueDate"] = _format_iso_date(due_date)
 
-        data = self._request("POST", f"/lists/{urllib.parse.quote(list_id)}/reminders", payload)
+        data = self._request("POST", f"/lists/{_quote_id(list_id)}/reminders", payload)
+        self._invalidate_list(list_id)
         return Reminder.from_dict(data, self)
 
     def update_reminder(
@@ -1209,7 +2084,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the reminder is not found
         """
-        payload = {}
+        payload: dict[str, Any] = {}
         if title is not None:
             payload["title"] = title
         if notes is not None:
@@ -1221,8 +2096,10 @@ class iCloudBridge:
         if due_date is not None:
             payload["dueDate"] = _format_iso_date(due_date)
 
-        data = self._request("PUT", f"/reminders/{urllib.parse.quote(reminder_id)}", payload)
-        return Reminder.from_dict(data, self)
+        data = self._request("PUT", f"/reminders/{_quote_id(reminder_id)}", payload)
+        reminder = Reminder.from_dict(data, self)
+        self._invalidate_list(reminder.list_id)
+        return reminder
 
     def delete_reminder(self, reminder_id: str) -> None:
         """
@@ -1234,7 +2111,9 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the reminder is not found
         """
-        self._request("DELETE", f"/reminders/{urllib.parse.quote(reminder_id)}")
+        self._request("DELETE", f"/reminders/{_quote_id(reminder_id)}")
+        # The owning list is not known here, so drop every cached list
+        self._list_cache.clear()
 
     def complete_reminder(self, reminder_id: str) -> Reminder:
         """
@@ -1273,8 +2152,13 @@ class iCloudBridge:
         Returns:
             list[Album]: All albums configured in iCloud Bridge
         """
-        data = self._request("GET", "/albums")
-        return [Album.from_dict(item, self) for item in data]
+        albums = self._album_cache.get(None)
+        if albums is None:
+            data = self._request("GET", "/albums", revalidate=True)
+            albums = [Album.from_dict(item, self) for item in data]
+            self._album_cache.set(None, albums)
+            self._album_cache.update((album.id, album) for album in albums)
+        return list(albums)
 
     def get_album(self, album_id: str) -> Album:
         """
@@ -1289,8 +2173,19 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the album is not found
         """
-        data = self._request("GET", f"/albums/{urllib.parse.quote(album_id)}")
-        return Album.from_dict(data, self)
+        album = self._album_cache.get(album_id)
+        if album is None:
+            data = self._request("GET", f"/albums/{_quote_id(album_id)}", revalidate=True)
+            album = Album.from_dict(data, self)
+            self._album_cache.set(album_id, album)
+        return album
+
+    def _album_photos_path(self, album_id: str) -> str:
+        """Get the (cached) photos path for an album, quoting the ID once."""
+        path = self._album_paths.get(album_id)
+        if path is None:
+            path = self._album_paths[album_id] = f"/albums/{_quote_id(album_id)}/photos"
+        return path
 
     def get_photos(
         self,
@@ -1316,23 +2211,39 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the album is not found
         """
-        path = f"/albums/{urllib.parse.quote(album_id)}/photos"
-        params = []
+        return self._get_photos_page(self._album_photos_path(album_id), limit, offset, sort, media_type)
+
+    def _get_photos_page(
+        self,
+        path: str,
+        limit: int,
+        offset: int,
+        sort: str,
+        media_type: Optional[str]
+    ) -> tuple[list[Photo], int]:
+        """Fetch one page of photos from an album's (already quoted) photos path."""
+        # Only non-default values are sent, keeping the query string short
+        params: dict[str, Any] = {}
         if limit != 100:
-            params.append(f"limit={limit}")
+            params["limit"] = limit
         if offset != 0:
-            params.append(f"offset={offset}")
+            params["offset"] = offset
         if sort != "album":
-            params.append(f"sort={sort}")
+            params["sort"] = sort
         if media_type is not None:
-            params.append(f"type={media_type}")
-
-        if params:
-            path += "?" + "&".join(params)
-
-        data = self._request("GET", path)
-        photos = [Photo.from_dict(item, self) for item in data["photos"]]
-        return photos, data["total"]
+            params["type"] = media_type
+
+        if ijson is not None and limit > _STREAM_PHOTOS_LIMIT:
+            if params:
+                path = f"{path}?{urllib.parse.urlencode(params)}"
+            _, page = self._stream(path, lambda body: _parse_photos_stream(body, self), self._json_headers)
+            assert page is not None
+            photos, total = page
+        else:
+            data = self._request_with_query(path, params)
+            photos, total = Photo.from_list(data["photos"], self), data["total"]
+        self._photo_cache.update((photo.id, photo) for photo in photos)
+        return photos, total
 
     def get_photo(self, photo_id: str) -> Photo:
         """
@@ -1347,34 +2258,200 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the photo is not found
         """
-        data = self._request("GET", f"/photos/{urllib.parse.quote(photo_id)}")
-        return Photo.from_dict(data, self)
+        photo = self._photo_cache.get(photo_id)
+        if photo is None:
+            data = self._request("GET", f"/photos/{_quote_id(photo_id)}")
+            photo = Photo.from_dict(data, self)
+            self._photo_cache.set(photo_id, photo)
+        return photo
+
+    def get_photos_bulk(self, photo_ids: list[str], concurrency: int = 8) -> list[Photo]:
+        """
+        Get several photos by ID.
+
+        Photos already in the metadata cache are returned without a request;
+        the rest are fetched in parallel over the shared connection pool.
+
+        Args:
+            photo_ids: The photo identifiers
+            concurrency: Maximum number of photos fetched at once (default: 8)
+
+        Returns:
+            list[Photo]: The requested photos, in the same order as ``photo_ids``
+
+        Raises:
+            NotFoundError: If any photo is not found
+        """
+        photos = {photo_id: self._photo_cache.get(photo_id) for photo_id in photo_ids}
+        missing = [photo_id for photo_id, photo in photos.items() if photo is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                photos.update(zip(missing, executor.map(self.get_photo, missing)))
+        return [photos[photo_id] for photo_id in photo_ids]
 
     def _iter_photos(
         self,
         album_id: str,
         sort: str = "album",
-        media_type: Optional[str] = None
+        media_type: Optional[str] = None,
+        prefetch: bool = True,
+        page_size: int = 100,
+        prefetch_pages: Optional[int] = None
     ) -> Iterator[Photo]:
         """
         Internal iterator for auto-paginating through photos.
 
+        When prefetch is enabled, the first page is fetched to learn the total,
+        then up to ``prefetch_pages`` of the remaining pages are fetched
+        concurrently while the caller consumes them in order. At most that many
+        pages are held in memory at once.
+
         Args:
             album_id: The album identifier
             sort: Sort order
             media_type: Filter by type
+            prefetch: Fetch upcoming pages while the current one is consumed
+            page_size: Number of photos requested per page
+            prefetch_pages: Number of pages to fetch ahead; 0 disables
+                prefetching like ``prefetch=False`` (default:
+                ``iCloudBridge.prefetch_pages``)
 
         Yields:
             Photo: Each photo in the album
         """
-        offset = 0
-        limit = 100
-        while True:
-            photos, total = self.get_photos(album_id, limit=limit, offset=offset, sort=sort, media_type=media_type)
+        limit = page_size
+
+        path = self._album_photos_path(album_id)
+
+        def fetch(offset: int) -> tuple[list[Photo], int]:
+            return self._get_photos_page(path, limit, offset, sort, media_type)
+
+        depth = self.prefetch_pages if prefetch_pages is None else prefetch_pages
+
+        photos, total = fetch(0)
+        if not prefetch or depth <= 0:
+            offset = 0
+            while True:
+                yield from photos
+                offset += limit
+                if offset >= total or len(photos) < limit:
+                    return
+                photos, total = fetch(offset)
+
+        if len(photos) < limit:
             yield from photos
-            offset += limit
-            if offset >= total:
-                break
+            return
+
+        # The total is known now, so the remaining pages can be requested in
+        # parallel; a bounded window keeps memory use flat for large albums
+        offsets = iter(range(limit, total, limit))
+        executor = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="icloudbridge-prefetch")
+        pending: deque[Future[tuple[list[Photo], int]]] = deque(
+            executor.submit(fetch, offset) for offset in islice(offsets, depth)
+        )
+        try:
+            yield from photos
+            while pending:
+                photos, _ = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(fetch, next_offset))
+                yield from photos
+        finally:
+            # Caller may have stopped early; drop pages nobody will consume
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_binary_once(
+        self,
+        photo_id: str,
+        suffix: str,
+        query: Optional[dict[str, str]] = None,
+        cache_key: Optional[str] = None,
+    ) -> tuple[Optional[bytes], float]:
+        """
+        Make a single attempt to get a binary photo resource.
+
+        Args:
+            photo_id: The photo identifier
+            suffix: Resource under the photo's path (e.g. "thumbnail", "image")
+            query: Query parameters, if any
+            cache_key: Key to look up and store the data under in the disk
+                cache, if it is enabled; None to bypass it
+
+        Returns:
+            tuple[Optional[bytes], float]: The data, or None and the server's
+            suggested retry delay in seconds if the download is pending
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the API returns an error
+        """
+        disk_cache = self._disk_cache
+        if disk_cache is not None and cache_key is not None:
+            cached = disk_cache.get(cache_key)
+            if cached is not None:
+                return cached, 0.0
+
+        path = f"/photos/{_quote_id(photo_id)}/{suffix}"
+        if query:
+            path = f"{path}?{urllib.parse.urlencode(query)}"
+
+        response, payload = self._get_bytes(path, photo_id)
+        if response.status == 202:
+            return None, float(response.getheader("Retry-After", "5"))
+
+        if disk_cache is not None and cache_key is not None:
+            disk_cache.set(cache_key, payload)
+        return payload, 0.0
+
+    def _fetch_binary(
+        self,
+        photo_id: str,
+        suffix: str,
+        query: Optional[dict[str, str]] = None,
+        retry_202: bool = False,
+        max_retries: int = 10,
+        max_wait: Optional[float] = None,
+        max_sleep: Optional[float] = None,
+        cache_key: Optional[str] = None,
+    ) -> bytes:
+        """
+        Get a binary photo resource, optionally polling while it is pending.
+
+        Args:
+            photo_id: The photo identifier
+            suffix: Resource under the photo's path (e.g. "thumbnail", "image")
+            query: Query parameters, if any
+            retry_202: Poll with backoff while the server answers 202, instead
+                of failing straight away
+            max_retries: Maximum attempts when polling (default: 10)
+            max_wait: Maximum total seconds to spend waiting between retries
+            max_sleep: Maximum seconds to sleep before any single retry
+            cache_key: Disk cache key for the data; None to bypass the cache
+
+        Returns:
+            bytes: The resource data
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the API returns an error
+            iCloudBridgeError: If the download is pending or times out
+        """
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+        for attempt in range(max_retries if retry_202 else 1):
+            payload, retry_after = self._fetch_binary_once(photo_id, suffix, query, cache_key)
+            if payload is not None:
+                return payload
+            if not retry_202:
+                raise iCloudBridgeError(f"Photo {suffix} download still pending: {photo_id}")
+            if attempt < max_retries - 1:
+                if deadline is None:
+                    # By default, wait no longer in total than sleeping for
+                    # the server's suggested delay between every attempt would
+                    deadline = time.monotonic() + (max_retries - 1) * retry_after
+                time.sleep(_backoff_delay(retry_after, attempt, deadline, max_sleep))
+
+        raise iCloudBridgeError(f"Photo {suffix} download timed out after {max_retries} retries")
 
     def get_thumbnail(self, photo_id: str, size: str = "medium") -> bytes:
         """
@@ -1390,31 +2467,59 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the photo is not found
         """
-        path = f"/photos/{urllib.parse.quote(photo_id)}/thumbnail"
-        if size != "medium":
-            path += f"?size={size}"
+        query = {"size": size} if size != "medium" else None
+        return self._fetch_binary(photo_id, "thumbnail", query, cache_key=f"thumb:{photo_id}:{size}")
 
-        url = f"{self.base_url}{path}"
-        request = urllib.request.Request(url, headers=self._get_headers())
+    def _image_cache_key(self, photo_id: str) -> Optional[str]:
+        """Get the disk cache key for a full-resolution image, if those are cached."""
+        return f"image:{photo_id}" if self._cache_images else None
 
-        try:
-            with urllib.request.urlopen(request) as response:
-                return response.read()
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise NotFoundError(f"Photo not found: {photo_id}")
-            raise APIError(e.code, str(e))
-        except urllib.error.URLError as e:
-            raise iCloudBridgeError(f"Connection failed: {e.reason}")
+    def _get_image_once(self, photo_id: str, wait: bool = False) -> tuple[Optional[bytes], float]:
+        """
+        Make a single attempt to get a full-resolution image.
+
+        Args:
+            photo_id: The photo identifier
+            wait: If True, ask the server to block until the download completes
+
+        Returns:
+            tuple[Optional[bytes], float]: The image data, or None and the
+            server's suggested retry delay in seconds if the download is pending
 
-    def get_image(self, photo_id: str, wait: bool = False, max_retries: int = 10) -> bytes:
+        Raises:
+            NotFoundError: If the photo is not found
+            iCloudBridgeError: If the download is pending despite ``wait``
+        """
+        query = {"wait": "true"} if wait else None
+        payload, retry_after = self._fetch_binary_once(photo_id, "image", query, self._image_cache_key(photo_id))
+        if payload is None and wait:
+            raise iCloudBridgeError("Image download pending despite wait=true")
+        return payload, retry_after
+
+    def get_image(
+        self,
+        photo_id: str,
+        wait: bool = False,
+        max_retries: int = 10,
+        max_wait: Optional[float] = None,
+        max_sleep: Optional[float] = None,
+    ) -> bytes:
         """
         Get full-resolution image.
 
+        While the server is still downloading the image from iCloud, it is
+        polled with exponential backoff and jitter, starting from the server's
+        suggested retry delay.
+
         Args:
             photo_id: The photo identifier
             wait: If True, block until download completes; if False, poll with retries
             max_retries: Maximum retry attempts for non-blocking mode (default: 10)
+            max_wait: Maximum total seconds to spend waiting between retries
+                (default: None, ``max_retries - 1`` times the server's suggested
+                delay; pass ``float("inf")`` for no limit)
+            max_sleep: Maximum seconds to sleep before any single retry,
+                overriding a longer server-suggested delay (default: None)
 
         Returns:
             bytes: Image data
@@ -1423,43 +2528,16 @@ class iCloudBridge:
             NotFoundError: If the photo is not found
             iCloudBridgeError: If download fails or times out
         """
-        import time
-
-        path = f"/photos/{urllib.parse.quote(photo_id)}/image"
-        if wait:
-            path += "?wait=true"
-
-        url = f"{self.base_url}{path}"
-        headers = self._get_headers()
-
-        for attempt in range(max_retries if not wait else 1):
-            request = urllib.request.Request(url, headers=headers)
-
-            try:
-                with urllib.request.urlopen(request) as response:
-                    return response.read()
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
-                    raise NotFoundError(f"Photo not found: {photo_id}")
-                elif e.code == 202:
-                    # Download pending, retry
-                    if wait:
-                        raise iCloudBridgeError("Image download pending despite wait=true")
-
-                    # Parse retry-after header
-                    retry_after = int(e.headers.get("Retry-After", "5"))
-
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_after)
-                        continue
-                    else:
-                        raise iCloudBridgeError(f"Image download timed out after {max_retries} retries")
-                else:
-                    raise APIError(e.code, str(e))
-            except urllib.error.URLError as e:
-                raise iCloudBridgeError(f"Connection failed: {e.reason}")
-
-        raise iCloudBridgeError("Image download failed")
+        return self._fetch_binary(
+            photo_id,
+            "image",
+            {"wait": "true"} if wait else None,
+            retry_202=not wait,
+            max_retries=max_retries,
+            max_wait=max_wait,
+            max_sleep=max_sleep,
+            cache_key=self._image_cache_key(photo_id),
+        )
 
     def get_video(self, photo_id: str) -> bytes:
         """
@@ -1475,19 +2553,7 @@ class iCloudBridge:
             NotFoundError: If the photo is not found
             APIError: If the photo is not a video
         """
-        path = f"/photos/{urllib.parse.quote(photo_id)}/video"
-        url = f"{self.base_url}{path}"
-        request = urllib.request.Request(url, headers=self._get_headers())
-
-        try:
-            with urllib.request.urlopen(request) as response:
-                return response.read()
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise NotFoundError(f"Photo not found: {photo_id}")
-            raise APIError(e.code, str(e))
-        except urllib.error.URLError as e:
-            raise iCloudBridgeError(f"Connection failed: {e.reason}")
+        return self._fetch_binary(photo_id, "video")
 
     def get_live_video(self, photo_id: str) -> bytes:
         """
@@ -1503,19 +2569,109 @@ class iCloudBridge:
             NotFoundError: If the photo is not found
             APIError: If the photo is not a Live Photo
         """
-        path = f"/photos/{urllib.parse.quote(photo_id)}/live-video"
-        url = f"{self.base_url}{path}"
-        request = urllib.request.Request(url, headers=self._get_headers())
+        return self._fetch_binary(photo_id, "live-video")
 
-        try:
-            with urllib.request.urlopen(request) as response:
-                return response.read()
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise NotFoundError(f"Photo not found: {photo_id}")
-            raise APIError(e.code, str(e))
-        except urllib.error.URLError as e:
-            raise iCloudBridgeError(f"Connection failed: {e.reason}")
+    def download_image(
+        self,
+        photo_id: str,
+        dest: Union[str, os.PathLike, BinaryIO],
+        wait: bool = False,
+        max_retries: int = 10,
+        max_wait: Optional[float] = None,
+        max_sleep: Optional[float] = None,
+    ) -> None:
+        """
+        Download a full-resolution image, streaming it to a file in chunks.
+
+        Args:
+            photo_id: The photo identifier
+            dest: File path or writable binary file object
+            wait: If True, block until download completes; if False, poll with retries
+            max_retries: Maximum retry attempts for non-blocking mode (default: 10)
+            max_wait: Maximum total seconds to spend waiting between retries
+                (default: None, ``max_retries - 1`` times the server's suggested
+                delay; pass ``float("inf")`` for no limit)
+            max_sleep: Maximum seconds to sleep before any single retry,
+                overriding a longer server-suggested delay (default: None)
+
+        Raises:
+            NotFoundError: If the photo is not found
+            iCloudBridgeError: If download fails or times out
+        """
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+        for attempt in range(max_retries if not wait else 1):
+            retry_after = self._download_image_once(photo_id, dest, wait=wait)
+            if retry_after is None:
+                return
+            if attempt < max_retries - 1:
+                if deadline is None:
+                    # By default, wait no longer in total than sleeping for
+                    # the server's suggested delay between every attempt would
+                    deadline = time.monotonic() + (max_retries - 1) * retry_after
+                time.sleep(_backoff_delay(retry_after, attempt, deadline, max_sleep))
+
+        raise iCloudBridgeError(f"Image download timed out after {max_retries} retries")
+
+    def _download_image_once(
+        self,
+        photo_id: str,
+        dest: Union[str, os.PathLike, BinaryIO],
+        wait: bool = False,
+    ) -> Optional[float]:
+        """
+        Make a single attempt to download a full-resolution image to a file.
+
+        Args:
+            photo_id: The photo identifier
+            dest: File path or writable binary file object
+            wait: If True, ask the server to block until the download completes
+
+        Returns:
+            Optional[float]: None once the image has been written, or the
+            server's suggested retry delay in seconds if the download is pending
+
+        Raises:
+            NotFoundError: If the photo is not found
+            iCloudBridgeError: If the download is pending despite ``wait``
+        """
+        path = f"/photos/{_quote_id(photo_id)}/image"
+        if wait:
+            path += "?wait=true"
+
+        response = self._download(path, dest)
+        if response.status != 202:
+            return None
+        if wait:
+            raise iCloudBridgeError("Image download pending despite wait=true")
+        return float(response.getheader("Retry-After", "5"))
+
+    def download_video(self, photo_id: str, dest: Union[str, os.PathLike, BinaryIO]) -> None:
+        """
+        Download a video file, streaming it to a file in chunks.
+
+        Args:
+            photo_id: The photo identifier
+            dest: File path or writable binary file object
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the photo is not a video
+        """
+        self._download(f"/photos/{_quote_id(photo_id)}/video", dest)
+
+    def download_live_video(self, photo_id: str, dest: Union[str, os.PathLike, BinaryIO]) -> None:
+        """
+        Download the motion video of a Live Photo, streaming it to a file in chunks.
+
+        Args:
+            photo_id: The photo identifier (must be a Live Photo)
+            dest: File path or writable binary file object
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the photo is not a Live Photo
+        """
+        self._download(f"/photos/{_quote_id(photo_id)}/live-video", dest)
 
     # Calendar operations
 
@@ -1526,7 +2682,7 @@ class iCloudBridge:
         Returns:
             list[Calendar]: All calendars configured in iCloud Bridge
         """
-        data = self._request("GET", "/calendars")
+        data = self._request("GET", "/calendars", revalidate=True)
         return [Calendar.from_dict(item, self) for item in data]
 
     def get_calendar(self, calendar_id: str) -> Calendar:
@@ -1542,7 +2698,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the calendar is not found
         """
-        data = self._request("GET", f"/calendars/{urllib.parse.quote(calendar_id)}")
+        data = self._request("GET", f"/calendars/{_quote_id(calendar_id)}", revalidate=True)
         return Calendar.from_dict(data, self)
 
     def get_events(self, calendar_id: str, start: datetime, end: datetime) -> list[Event]:
@@ -1560,10 +2716,8 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the calendar is not found
         """
-        start_str = _format_iso_date(start)
-        end_str = _format_iso_date(end)
-        path = f"/calendars/{urllib.parse.quote(calendar_id)}/events?start={start_str}&end={end_str}"
-        data = self._request("GET", path)
+        params = {"start": _format_iso_date(start), "end": _format_iso_date(end)}
+        data = self._request_with_query(f"/calendars/{_quote_id(calendar_id)}/events", params)
         return [Event.from_dict(item, self) for item in data]
 
     def get_event(self, event_id: str) -> Event:
@@ -1579,7 +2733,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the event is not found
         """
-        data = self._request("GET", f"/events/{urllib.parse.quote(event_id)}")
+        data = self._request("GET", f"/events/{_quote_id(event_id)}")
         return Event.from_dict(data, self)
 
     def create_event(
@@ -1620,7 +2774,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the calendar is not found
         """
-        payload = {
+        payload: dict[str, Any] = {
             "title": title,
             "startDate": _format_iso_date(start_date),
             "endDate": _format_iso_date(end_date),
@@ -1640,7 +2794,7 @@ class iCloudBridge:
         if recurrence_rule is not None:
             payload["recurrenceRule"] = recurrence_rule.to_dict()
 
-        data = self._request("POST", f"/calendars/{urllib.parse.quote(calendar_id)}/events", payload)
+        data = self._request("POST", f"/calendars/{_quote_id(calendar_id)}/events", payload)
         return Event.from_dict(data, self)
 
     def update_event(
@@ -1683,7 +2837,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the event is not found
         """
-        payload = {}
+        payload: dict[str, Any] = {}
         if title is not None:
             payload["title"] = title
         if notes is not None:
@@ -1707,7 +2861,7 @@ class iCloudBridge:
         if recurrence_rule is not None:
             payload["recurrenceRule"] = recurrence_rule.to_dict()
 
-        path = f"/events/{urllib.parse.quote(event_id)}"
+        path = f"/events/{_quote_id(event_id)}"
         if span != "thisEvent":
             path += f"?span={span}"
 
@@ -1725,7 +2879,7 @@ class iCloudBridge:
         Raises:
             NotFoundError: If the event is not found
         """
-        path = f"/events/{urllib.parse.quote(event_id)}"
+        path = f"/events/{_quote_id(event_id)}"
         if span != "thisEvent":
             path += f"?span={span}"
         self._request("DELETE", path)
@@ -1748,53 +2902,65 @@ def connect(host: str = "localhost", port: int = 31337) -> iCloudBridge:
 
 if __name__ == "__main__":
     # Simple demo/test
+    from datetime import timedelta
+
     client = iCloudBridge()
 
     try:
-        health = client.health()
-        print(f"Server status: {health}")
-
-        # Test Reminders
-        lists = client.get_lists()
-        print(f"\nFound {len(lists)} reminder lists:")
-        for lst in lists:
-            print(f"  - {lst.title} ({lst.reminder_count} reminders)")
-
-        if lists:
-            reminders = client.get_reminders(lists[0].id)
-            print(f"\nIncomplete reminders in '{lists[0].title}':")
-            for r in reminders:
-                status = "[x]" if r.is_completed else "[ ]"
-                print(f"  {status} {r.title}")
-
-        # Test Photos
-        albums = client.get_albums()
-        print(f"\nFound {len(albums)} photo albums:")
-        for album in albums:
-            print(f"  - {album.title} ({album.photo_count} photos, {album.video_count} videos)")
-
-        if albums:
-            photos, total = client.get_photos(albums[0].id, limit=5)
-            print(f"\nFirst 5 photos in '{albums[0].title}' (total: {total}):")
-            for photo in photos:
-                print(f"  - {photo.filename or photo.id} ({photo.width}x{photo.height}, {photo.media_type})")
-
-        # Test Calendars
-        calendars = client.get_calendars()
-        print(f"\nFound {len(calendars)} calendars:")
-        for cal in calendars:
-            read_only = " (read-only)" if cal.is_read_only else ""
-            print(f"  - {cal.title} ({cal.event_count} events){read_only}")
-
-        if calendars:
-            from datetime import timedelta
+        # The top-level lookups are independent, so issue them in parallel;
+        # the wall-clock time is then that of the slowest one, not the sum
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            health_f = executor.submit(client.health)
+            lists_f = executor.submit(client.get_lists)
+            albums_f = executor.submit(client.get_albums)
+            calendars_f = executor.submit(client.get_calendars)
+            health = health_f.result()
+            lists = lists_f.result()
+            albums = albums_f.result()
+            calendars = calendars_f.result()
+
+            # Then fetch the details for the first of each in parallel too
             start = datetime.now()
             end = start + timedelta(days=7)
-            events = client.get_events(calendars[0].id, start, end)
-            print(f"\nNext 7 days of events in '{calendars[0].title}':")
-            for event in events[:5]:  # Limit to 5
-                time_str = event.start_date.strftime("%Y-%m-%d %H:%M")
-                print(f"  - {time_str}: {event.title}")
+            reminders_f = executor.submit(client.get_reminders, lists[0].id) if lists else None
+            photos_f = executor.submit(client.get_photos, albums[0].id, limit=5) if albums else None
+            events_f = executor.submit(client.get_events, calendars[0].id, start, end) if calendars else None
+
+            print(f"Server status: {health}")
+
+            # Test Reminders
+            print(f"\nFound {len(lists)} reminder lists:")
+            for lst in lists:
+                print(f"  - {lst.title} ({lst.reminder_count} reminders)")
+
+            if reminders_f is not None:
+                print(f"\nIncomplete reminders in '{lists[0].title}':")
+                for r in reminders_f.result():
+                    status = "[x]" if r.is_completed else "[ ]"
+                    print(f"  {status} {r.title}")
+
+            # Test Photos
+            print(f"\nFound {len(albums)} photo albums:")
+            for album in albums:
+                print(f"  - {album.title} ({album.photo_count} photos, {album.video_count} videos)")
+
+            if photos_f is not None:
+                photos, total = photos_f.result()
+                print(f"\nFirst 5 photos in '{albums[0].title}' (total: {total}):")
+                for photo in photos:
+                    print(f"  - {photo.filename or photo.id} ({photo.width}x{photo.height}, {photo.media_type})")
+
+            # Test Calendars
+            print(f"\nFound {len(calendars)} calendars:")
+            for cal in calendars:
+                read_only = " (read-only)" if cal.is_read_only else ""
+                print(f"  - {cal.title} ({cal.event_count} events){read_only}")
+
+            if events_f is not None:
+                print(f"\nNext 7 days of events in '{calendars[0].title}':")
+                for event in events_f.result()[:5]:  # Limit to 5
+                    time_str = event.start_date.strftime("%Y-%m-%d %H:%M")
+                    print(f"  - {time_str}: {event.title}")
 
     except iCloudBridgeError as e:
         print(f"Error: {e}")
@@ -0,0 +1,860 @@
+"""
+iCloud Bridge Async Client
+
+An asyncio interface to the iCloud Bridge REST API, built on the synchronous
+client in ``icloudbridge``. Blocking HTTP calls run on a dedicated thread pool,
+so many requests can be in flight at once from a single event loop while all
+of them share the client's keep-alive connection pool.
+
+Uses only the standard library - no external dependencies required.
+
+Basic Usage:
+    import asyncio
+    from icloudbridge_async import AsyncICloudBridge
+
+    async def main():
+        async with AsyncICloudBridge() as client:
+            albums = await client.get_albums()
+
+            # Iterate photos, auto-paginating
+            photos = [photo async for photo in client.iter_photos(albums[0].id)]
+
+            # Download thumbnails concurrently
+            thumbnails = await client.get_thumbnails([p.id for p in photos], size="small")
+
+    asyncio.run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, AsyncIterator, BinaryIO, Callable, Optional, TypeVar, Union
+
+try:
+    from .icloudbridge import (  # type: ignore
+        Alarm,
+        Album,
+        Calendar,
+        Event,
+        Photo,
+        RecurrenceRule,
+        Reminder,
+        ReminderList,
+        iCloudBridge,
+        iCloudBridgeError,
+    )
+except ImportError:
+    # Installed as flat modules (py-modules), not as a package
+    from icloudbridge import (  # type: ignore
+        Alarm,
+        Album,
+        Calendar,
+        Event,
+        Photo,
+        RecurrenceRule,
+        Reminder,
+        ReminderList,
+        iCloudBridge,
+        iCloudBridgeError,
+    )
+
+T = TypeVar("T")
+
+# Bounds for the delay between polls of a pending image download, in seconds
+_MIN_RETRY_DELAY = 0.5
+_MAX_RETRY_DELAY = 60.0
+
+
+class AsyncICloudBridge:
+    """
+    Async client for the iCloud Bridge REST API.
+
+    The worker threads that perform the HTTP calls are started on first use.
+    Use the client as an async context manager, or call ``close()`` when done,
+    to shut them down.
+
+    Objects returned by this client (albums, photos, reminders, ...) are bound
+    to the underlying synchronous client, so their convenience methods block.
+
+    Args:
+        host: The hostname of the iCloud Bridge server (default: localhost)
+        port: The port number (default: 31337)
+        token: Bearer token for authentication (required for remote connections)
+        max_workers: Maximum number of requests in flight at once (default: 32)
+        **kwargs: Other options for the underlying :class:`iCloudBridge`,
+            such as ``cache_ttl``, ``cache_dir`` or ``retry_total``
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 31337,
+        token: Optional[str] = None,
+        max_workers: int = 32,
+        **kwargs: Any,
+    ):
+        self._client = iCloudBridge(host=host, port=port, token=token, **kwargs)
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> AsyncICloudBridge:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Shut down the worker threads.
+
+        Connections are left open: the pool is shared by every client for the
+        same host and port, sync or async.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking client call on the worker threads."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="icloudbridge",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[dict] = None,
+    ) -> Any:
+        """Make an HTTP request to the API."""
+        return await self._run(self._client._request, method, path, data)
+
+    # Health check
+
+    async def health(self) -> dict:
+        """
+        Check if the server is running.
+
+        Returns:
+            dict: Health status (e.g., {"status": "ok"})
+        """
+        return await self._run(self._client.health)
+
+    # Reminder list operations
+
+    async def get_lists(self) -> list[ReminderList]:
+        """
+        Get all available reminder lists.
+
+        Returns:
+            list[ReminderList]: All reminder lists configured in iCloud Bridge
+        """
+        return await self._run(self._client.get_lists)
+
+    async def get_list(self, list_id: str) -> ReminderList:
+        """
+        Get a specific reminder list by ID.
+
+        Args:
+            list_id: The list identifier
+
+        Returns:
+            ReminderList: The requested list
+
+        Raises:
+            NotFoundError: If the list is not found
+        """
+        return await self._run(self._client.get_list, list_id)
+
+    # Reminder operations
+
+    async def get_reminders(self, list_id: str, include_completed: bool = False) -> list[Reminder]:
+        """
+        Get reminders in a specific list.
+
+        Args:
+            list_id: The list identifier
+            include_completed: Whether to include completed reminders (default: False)
+
+        Returns:
+            list[Reminder]: Reminders in the list (incomplete only by default)
+
+        Raises:
+            NotFoundError: If the list is not found
+        """
+        return await self._run(self._client.get_reminders, list_id, include_completed=include_completed)
+
+    async def get_all_reminders(self, include_completed: bool = False) -> dict[str, list[Reminder]]:
+        """
+        Get the reminders in every list, fetching the lists concurrently.
+
+        Args:
+            include_completed: Whether to include completed reminders (default: False)
+
+        Returns:
+            dict[str, list[Reminder]]: Reminders keyed by list ID
+        """
+        lists = await self.get_lists()
+        results = await asyncio.gather(
+            *(self.get_reminders(reminder_list.id, include_completed=include_completed) for reminder_list in lists)
+        )
+        return {reminder_list.id: reminders for reminder_list, reminders in zip(lists, results)}
+
+    async def get_reminder(self, reminder_id: str) -> Reminder:
+        """
+        Get a specific reminder by ID.
+
+        Args:
+            reminder_id: The reminder identifier
+
+        Returns:
+            Reminder: The requested reminder
+
+        Raises:
+            NotFoundError: If the reminder is not found
+        """
+        return await self._run(self._client.get_reminder, reminder_id)
+
+    async def create_reminder(
+        self,
+        list_id: str,
+        title: str,
+        notes: Optional[str] = None,
+        priority: Optional[int] = None,
+        due_date: Optional[datetime] = None,
+    ) -> Reminder:
+        """
+        Create a new reminder in a list.
+
+        Args:
+            list_id: The list to create the reminder in
+            title: The reminder title
+            notes: Optional notes/description
+            priority: Priority level (0=none, 1=high, 5=medium, 9=low)
+            due_date: Optional due date
+
+        Returns:
+            Reminder: The created reminder
+
+        Raises:
+            NotFoundError: If the list is not found
+        """
+        return await self._run(
+            self._client.create_reminder,
+            list_id,
+            title,
+            notes=notes,
+            priority=priority,
+            due_date=due_date,
+        )
+
+    async def update_reminder(
+        self,
+        reminder_id: str,
+        title: Optional[str] = None,
+        notes: Optional[str] = None,
+        is_completed: Optional[bool] = None,
+        priority: Optional[int] = None,
+        due_date: Optional[datetime] = None,
+    ) -> Reminder:
+        """
+        Update an existing reminder.
+
+        Args:
+            reminder_id: The reminder to update
+            title: New title (if changing)
+            notes: New notes (if changing)
+            is_completed: New completion status (if changing)
+            priority: New priority (if changing)
+            due_date: New due date (if changing)
+
+        Returns:
+            Reminder: The updated reminder
+
+        Raises:
+            NotFoundError: If the reminder is not found
+        """
+        return await self._run(
+            self._client.update_reminder,
+            reminder_id,
+            title=title,
+            notes=notes,
+            is_completed=is_completed,
+            priority=priority,
+            due_date=due_date,
+        )
+
+    async def delete_reminder(self, reminder_id: str) -> None:
+        """
+        Delete a reminder.
+
+        Args:
+            reminder_id: The reminder to delete
+
+        Raises:
+            NotFoundError: If the reminder is not found
+        """
+        await self._run(self._client.delete_reminder, reminder_id)
+
+    async def complete_reminder(self, reminder_id: str) -> Reminder:
+        """
+        Mark a reminder as completed.
+
+        Args:
+            reminder_id: The reminder to complete
+
+        Returns:
+            Reminder: The updated reminder
+        """
+        return await self.update_reminder(reminder_id, is_completed=True)
+
+    async def uncomplete_reminder(self, reminder_id: str) -> Reminder:
+        """
+        Mark a reminder as not completed.
+
+        Args:
+            reminder_id: The reminder to uncomplete
+
+        Returns:
+            Reminder: The updated reminder
+        """
+        return await self.update_reminder(reminder_id, is_completed=False)
+
+    # Album operations
+
+    async def get_albums(self) -> list[Album]:
+        """
+        Get all available photo albums.
+
+        Returns:
+            list[Album]: All albums configured in iCloud Bridge
+        """
+        return await self._run(self._client.get_albums)
+
+    async def get_album(self, album_id: str) -> Album:
+        """
+        Get a specific album by ID.
+
+        Args:
+            album_id: The album identifier
+
+        Returns:
+            Album: The requested album
+
+        Raises:
+            NotFoundError: If the album is not found
+        """
+        return await self._run(self._client.get_album, album_id)
+
+    async def get_photos(
+        self,
+        album_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        sort: str = "album",
+        media_type: Optional[str] = None
+    ) -> tuple[list[Photo], int]:
+        """
+        Get photos in a specific album.
+
+        Args:
+            album_id: The album identifier
+            limit: Number of photos per page (default: 100)
+            offset: Number of photos to skip (default: 0)
+            sort: Sort order - "album", "date-asc", or "date-desc" (default: "album")
+            media_type: Filter by type - "photo", "video", "live", or "all" (default: None/all)
+
+        Returns:
+            tuple[list[Photo], int]: Photos and total count
+
+        Raises:
+            NotFoundError: If the album is not found
+        """
+        return await self._run(
+            self._client.get_photos,
+            album_id,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            media_type=media_type,
+        )
+
+    async def get_photo(self, photo_id: str) -> Photo:
+        """
+        Get a specific photo by ID.
+
+        Args:
+            photo_id: The photo identifier
+
+        Returns:
+            Photo: The requested photo
+
+        Raises:
+            NotFoundError: If the photo is not found
+        """
+        return await self._run(self._client.get_photo, photo_id)
+
+    async def get_photos_bulk(self, photo_ids: list[str], concurrency: int = 8) -> list[Photo]:
+        """
+        Get several photos by ID, fetching uncached ones concurrently.
+
+        Args:
+            photo_ids: The photo identifiers
+            concurrency: Maximum number of photos fetched at once (default: 8)
+
+        Returns:
+            list[Photo]: The requested photos, in the same order as ``photo_ids``
+
+        Raises:
+            NotFoundError: If any photo is not found
+        """
+        return await self._run(self._client.get_photos_bulk, photo_ids, concurrency=concurrency)
+
+    async def iter_photos(
+        self,
+        album_id: str,
+        sort: str = "album",
+        media_type: Optional[str] = None,
+        page_size: int = 100,
+        prefetch_pages: int = 4
+    ) -> AsyncIterator[Photo]:
+        """
+        Iterate all photos in an album, auto-paginating.
+
+        Once the first page reveals the total, up to ``prefetch_pages`` of the
+        remaining pages are requested concurrently while the caller consumes
+        them in order.
+
+        Args:
+            album_id: The album identifier
+            sort: Sort order - "album", "date-asc", or "date-desc"
+            media_type: Filter by type - "photo", "video", "live", or "all"
+            page_size: Number of photos requested per page (default: 100)
+            prefetch_pages: Number of pages to fetch ahead; 0 requests each
+                page only once the previous one is consumed (default: 4)
+
+        Yields:
+            Photo: Each photo in the album
+        """
+        limit = page_size
+
+        def fetch(offset: int) -> asyncio.Future[tuple[list[Photo], int]]:
+            return asyncio.ensure_future(
+                self.get_photos(album_id, limit=limit, offset=offset, sort=sort, media_type=media_type)
+            )
+
+        photos, total = await self.get_photos(album_id, limit=limit, offset=0, sort=sort, media_type=media_type)
+        offsets = iter(range(limit, total, limit) if len(photos) == limit else ())
+        depth = max(0, prefetch_pages)
+        pending = deque(fetch(offset) for offset in islice(offsets, depth))
+        try:
+            for photo in photos:
+                yield photo
+            while True:
+                if not pending:
+                    # Only reached without prefetching, or once all pages are in
+                    next_offset = next(offsets, None)
+                    if next_offset is None:
+                        break
+                    pending.append(fetch(next_offset))
+                photos, _ = await pending.popleft()
+                if depth:
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append(fetch(next_offset))
+                for photo in photos:
+                    yield photo
+        finally:
+            # Caller stopped early; drop pages nobody will consume
+            for future in pending:
+                future.cancel()
+
+    # Downloads
+
+    async def get_thumbnail(self, photo_id: str, size: str = "medium") -> bytes:
+        """
+        Get a thumbnail image.
+
+        Args:
+            photo_id: The photo identifier
+            size: Thumbnail size - "small" (200px) or "medium" (800px)
+
+        Returns:
+            bytes: JPEG image data
+
+        Raises:
+            NotFoundError: If the photo is not found
+        """
+        return await self._run(self._client.get_thumbnail, photo_id, size=size)
+
+    async def get_thumbnails(
+        self,
+        photo_ids: list[str],
+        size: str = "medium",
+        concurrency: int = 16,
+    ) -> list[bytes]:
+        """
+        Download thumbnails for many photos concurrently.
+
+        Args:
+            photo_ids: The photo identifiers to fetch thumbnails for
+            size: Thumbnail size - "small" (200px) or "medium" (800px)
+            concurrency: Maximum number of downloads in flight at once (default: 16)
+
+        Returns:
+            list[bytes]: JPEG image data, in the same order as ``photo_ids``
+
+        Raises:
+            NotFoundError: If any photo is not found
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(photo_id: str) -> bytes:
+            async with semaphore:
+                return await self.get_thumbnail(photo_id, size=size)
+
+        return list(await asyncio.gather(*(fetch(photo_id) for photo_id in photo_ids)))
+
+    async def get_image(
+        self,
+        photo_id: str,
+        wait: bool = False,
+        max_retries: int = 10,
+        cancel: Optional[asyncio.Event] = None,
+    ) -> bytes:
+        """
+        Get full-resolution image.
+
+        While the server is still downloading the image from iCloud, the
+        client polls it without blocking the event loop, so other requests
+        keep running in the meantime.
+
+        Args:
+            photo_id: The photo identifier
+            wait: If True, block until download completes; if False, poll with retries
+            max_retries: Maximum retry attempts for non-blocking mode (default: 10)
+            cancel: Event that stops polling as soon as it is set
+
+        Returns:
+            bytes: Image data
+
+        Raises:
+            NotFoundError: If the photo is not found
+            iCloudBridgeError: If download fails, times out or is cancelled
+        """
+        for attempt in range(max_retries if not wait else 1):
+            payload, retry_after = await self._run(self._client._get_image_once, photo_id, wait=wait)
+            if payload is not None:
+                return payload
+            await self._wait_pending(attempt, max_retries, retry_after, cancel)
+
+        raise iCloudBridgeError(f"Image download timed out after {max_retries} retries")
+
+    async def _wait_pending(
+        self,
+        attempt: int,
+        max_retries: int,
+        retry_after: float,
+        cancel: Optional[asyncio.Event],
+    ) -> None:
+        """
+        Wait before polling a pending image download again.
+
+        Raises:
+            iCloudBridgeError: If no retries are left or ``cancel`` is set
+        """
+        if attempt >= max_retries - 1:
+            raise iCloudBridgeError(f"Image download timed out after {max_retries} retries")
+
+        # Guard against a missing or absurd Retry-After from the server
+        delay = min(max(retry_after, _MIN_RETRY_DELAY), _MAX_RETRY_DELAY)
+        if cancel is None:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(cancel.wait(), delay)
+        except asyncio.TimeoutError:
+            return
+        raise iCloudBridgeError("Image download cancelled")
+
+    async def get_video(self, photo_id: str) -> bytes:
+        """
+        Get video file for a video or Live Photo.
+
+        Args:
+            photo_id: The photo identifier
+
+        Returns:
+            bytes: Video data
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the photo is not a video
+        """
+        return await self._run(self._client.get_video, photo_id)
+
+    async def get_live_video(self, photo_id: str) -> bytes:
+        """
+        Get motion video component for a Live Photo.
+
+        Args:
+            photo_id: The photo identifier (must be a Live Photo)
+
+        Returns:
+            bytes: Video data
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the photo is not a Live Photo
+        """
+        return await self._run(self._client.get_live_video, photo_id)
+
+    async def download_image(
+        self,
+        photo_id: str,
+        dest: Union[str, os.PathLike, BinaryIO],
+        wait: bool = False,
+        max_retries: int = 10,
+        cancel: Optional[asyncio.Event] = None,
+    ) -> None:
+        """
+        Download a full-resolution image, streaming it to a file in chunks.
+
+        Args:
+            photo_id: The photo identifier
+            dest: File path or writable binary file object
+            wait: If True, block until download completes; if False, poll with retries
+            max_retries: Maximum retry attempts for non-blocking mode (default: 10)
+            cancel: Event that stops polling as soon as it is set
+
+        Raises:
+            NotFoundError: If the photo is not found
+            iCloudBridgeError: If download fails, times out or is cancelled
+        """
+        for attempt in range(max_retries if not wait else 1):
+            retry_after = await self._run(self._client._download_image_once, photo_id, dest, wait=wait)
+            if retry_after is None:
+                return
+            await self._wait_pending(attempt, max_retries, retry_after, cancel)
+
+        raise iCloudBridgeError(f"Image download timed out after {max_retries} retries")
+
+    async def download_video(self, photo_id: str, dest: Union[str, os.PathLike, BinaryIO]) -> None:
+        """
+        Download a video file, streaming it to a file in chunks.
+
+        Args:
+            photo_id: The photo identifier
+            dest: File path or writable binary file object
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the photo is not a video
+        """
+        await self._run(self._client.download_video, photo_id, dest)
+
+    async def download_live_video(self, photo_id: str, dest: Union[str, os.PathLike, BinaryIO]) -> None:
+        """
+        Download the motion video of a Live Photo, streaming it to a file in chunks.
+
+        Args:
+            photo_id: The photo identifier (must be a Live Photo)
+            dest: File path or writable binary file object
+
+        Raises:
+            NotFoundError: If the photo is not found
+            APIError: If the photo is not a Live Photo
+        """
+        await self._run(self._client.download_live_video, photo_id, dest)
+
+    # Calendar operations
+
+    async def get_calendars(self) -> list[Calendar]:
+        """
+        Get all available calendars.
+
+        Returns:
+            list[Calendar]: All calendars configured in iCloud Bridge
+        """
+        return await self._run(self._client.get_calendars)
+
+    async def get_calendar(self, calendar_id: str) -> Calendar:
+        """
+        Get a specific calendar by ID.
+
+        Args:
+            calendar_id: The calendar identifier
+
+        Returns:
+            Calendar: The requested calendar
+
+        Raises:
+            NotFoundError: If the calendar is not found
+        """
+        return await self._run(self._client.get_calendar, calendar_id)
+
+    async def get_events(self, calendar_id: str, start: datetime, end: datetime) -> list[Event]:
+        """
+        Get events in a calendar within a date range.
+
+        Args:
+            calendar_id: The calendar identifier
+            start: Start of date range
+            end: End of date range
+
+        Returns:
+            list[Event]: Events in the date range
+
+        Raises:
+            NotFoundError: If the calendar is not found
+        """
+        return await self._run(self._client.get_events, calendar_id, start, end)
+
+    async def get_event(self, event_id: str) -> Event:
+        """
+        Get a specific event by ID.
+
+        Args:
+            event_id: The event identifier
+
+        Returns:
+            Event: The requested event
+
+        Raises:
+            NotFoundError: If the event is not found
+        """
+        return await self._run(self._client.get_event, event_id)
+
+    async def create_event(
+        self,
+        calendar_id: str,
+        title: str,
+        start_date: datetime,
+        end_date: datetime,
+        notes: Optional[str] = None,
+        location: Optional[str] = None,
+        url: Optional[str] = None,
+        is_all_day: bool = False,
+        availability: str = "busy",
+        travel_time: Optional[int] = None,
+        alarms: Optional[list[Alarm]] = None,
+        recurrence_rule: Optional[RecurrenceRule] = None,
+    ) -> Event:
+        """
+        Create a new event in a calendar.
+
+        Args:
+            calendar_id: The calendar to create the event in
+            title: The event title
+            start_date: Event start date/time
+            end_date: Event end date/time
+            notes: Optional notes/description
+            location: Optional location
+            url: Optional URL
+            is_all_day: Whether this is an all-day event
+            availability: "busy", "free", "tentative", or "unavailable"
+            travel_time: Minutes of travel time before event
+            alarms: List of alarms
+            recurrence_rule: Recurrence rule for repeating events
+
+        Returns:
+            Event: The created event
+
+        Raises:
+            NotFoundError: If the calendar is not found
+        """
+        return await self._run(
+            self._client.create_event,
+            calendar_id,
+            title,
+            start_date,
+            end_date,
+            notes=notes,
+            location=location,
+            url=url,
+            is_all_day=is_all_day,
+            availability=availability,
+            travel_time=travel_time,
+            alarms=alarms,
+            recurrence_rule=recurrence_rule,
+        )
+
+    async def update_event(
+        self,
+        event_id: str,
+        span: str = "thisEvent",
+        title: Optional[str] = None,
+        notes: Optional[str] = None,
+        location: Optional[str] = None,
+        url: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        is_all_day: Optional[bool] = None,
+        availability: Optional[str] = None,
+        travel_time: Optional[int] = None,
+        alarms: Optional[list[Alarm]] = None,
+        recurrence_rule: Optional[RecurrenceRule] = None,
+    ) -> Event:
+        """
+        Update an existing event.
+
+        Args:
+            event_id: The event to update
+            span: For recurring events - "thisEvent", "futureEvents", or "allEvents"
+            title: New title (if changing)
+            notes: New notes (if changing)
+            location: New location (if changing)
+            url: New URL (if changing)
+            start_date: New start date (if changing)
+            end_date: New end date (if changing)
+            is_all_day: New all-day status (if changing)
+            availability: New availability (if changing)
+            travel_time: New travel time (if changing)
+            alarms: New alarms (if changing)
+            recurrence_rule: New recurrence rule (if changing)
+
+        Returns:
+            Event: The updated event
+
+        Raises:
+            NotFoundError: If the event is not found
+        """
+        return await self._run(
+            self._client.update_event,
+            event_id,
+            span=span,
+            title=title,
+            notes=notes,
+            location=location,
+            url=url,
+            start_date=start_date,
+            end_date=end_date,
+            is_all_day=is_all_day,
+            availability=availability,
+            travel_time=travel_time,
+            alarms=alarms,
+            recurrence_rule=recurrence_rule,
+        )
+
+    async def delete_event(self, event_id: str, span: str = "thisEvent") -> None:
+        """
+        Delete an event.
+
+        Args:
+            event_id: The event to delete
+            span: For recurring events - "thisEvent", "futureEvents", or "allEvents"
+
+        Raises:
+            NotFoundError: If the event is not found
+        """
+        await self._run(self._client.delete_event, event_id, span=span)